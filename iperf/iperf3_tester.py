@@ -3,14 +3,24 @@ import json
 import os
 import random
 import re
+import select
 import shlex
 import shutil
+import socket
+import socketserver
 import subprocess
 import sys
 import time
 import unicodedata
 import builtins
 import argparse
+import locale
+import threading
+
+try:
+    import curses
+except ImportError:
+    curses = None
 
 # ==========================================
 # Constants
@@ -25,6 +35,18 @@ IPERF_TEST_MSS = 1300
 IPERF_GOOD_MBPS = 150.0
 IPERF_EXCELLENT_MBPS = 200.0
 IPERF_POOR_MBPS = 100.0
+IPERF_LIVE_REFRESH_SECONDS = 0.5
+IPERF_LIVE_HISTORY_SECONDS = 60
+IPERF_LIVE_FAILURE_ROWS = 3
+IPERF_LEASE_DEFAULT_PORT = 9778
+IPERF_LEASE_DEFAULT_SECONDS = 60
+IPERF_LEASE_MAX_SECONDS = 600
+IPERF_LEASE_GRACE_SECONDS = 10
+IPERF_LEASE_WAIT_TIMEOUT = 900
+IPERF_LEASE_REPORT_SECONDS = 30
+IPERF_LEASE_REPORT_ROWS = 10
+IPERF_LEASE_MAX_QUEUE = 256
+IPERF_LEASE_MAX_CONNECTIONS_PER_CLIENT = 8
 
 # ==========================================
 # UI & CLI Helpers
@@ -194,6 +216,128 @@ def run_iperf3_json(command_args):
         return None, str(payload.get("error"))
     return payload, ""
 
+_IPERF3_JSON_STREAM_SUPPORTED = None
+
+def iperf3_supports_json_stream():
+    global _IPERF3_JSON_STREAM_SUPPORTED
+    if _IPERF3_JSON_STREAM_SUPPORTED is None:
+        try:
+            result = subprocess.run(["iperf3", "--help"], check=False, text=True, capture_output=True)
+            help_text = (result.stdout or "") + (result.stderr or "")
+        except Exception:
+            help_text = ""
+        _IPERF3_JSON_STREAM_SUPPORTED = "--json-stream" in help_text
+    return _IPERF3_JSON_STREAM_SUPPORTED
+
+def run_iperf3_json_stream(command_args, on_interval):
+    # iperf3 >= 3.17 emits one JSON event per line; intervals arrive every second.
+    try:
+        proc = subprocess.Popen(
+            command_args + ["--json-stream"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    except Exception as exc:
+        return None, f"failed to run iperf3: {exc}"
+
+    end_data = None
+    error = ""
+    stray = []
+    try:
+        for raw_line in proc.stdout:
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except Exception:
+                stray.append(line)
+                continue
+            if not isinstance(event, dict):
+                continue
+            name = event.get("event")
+            data = event.get("data")
+            if name == "interval" and isinstance(data, dict):
+                bps = float(data.get("sum", {}).get("bits_per_second", 0.0) or 0.0)
+                on_interval(bps / 1_000_000.0)
+            elif name == "end" and isinstance(data, dict):
+                end_data = data
+            elif name == "error":
+                error = str(data)
+    except BaseException:
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        proc.wait()
+        raise
+    proc.wait()
+
+    if error:
+        return None, error
+    if proc.returncode != 0 or end_data is None:
+        return None, " ".join(stray) or "iperf3 exited with non-zero status"
+    return {"end": end_data}, ""
+
+IPERF_TEXT_LINE_PATTERN = re.compile(
+    r"^\[\s*(SUM|\d+)\]\s+[\d.]+-[\d.]+\s+sec\s+[\d.]+\s+\w?Bytes\s+"
+    r"([\d.]+)\s+([KMG]?)bits/sec\s*(.*)$"
+)
+IPERF_TEXT_RATE_SCALE = {"": 1.0, "K": 1e3, "M": 1e6, "G": 1e9}
+
+def run_iperf3_text_stream(command_args, streams, on_interval):
+    # Fallback for iperf3 < 3.17: parse flushed human-readable interval and summary lines.
+    args = [arg for arg in command_args if arg != "-J"] + ["--forceflush", "-i", "1"]
+    try:
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    except Exception as exc:
+        return None, f"failed to run iperf3: {exc}"
+
+    # With a single stream iperf3 prints no [SUM] rows, so the stream row is the total.
+    wanted_id = "SUM" if int(streams) > 1 else None
+    summary = {}
+    errors = []
+    try:
+        for raw_line in proc.stdout:
+            line = raw_line.strip()
+            if "error" in line.lower():
+                errors.append(line)
+                continue
+            match = IPERF_TEXT_LINE_PATTERN.match(line)
+            if not match:
+                continue
+            stream_id, rate, unit, tail = match.groups()
+            if (stream_id == "SUM") != (wanted_id == "SUM"):
+                continue
+            bps = float(rate) * IPERF_TEXT_RATE_SCALE[unit]
+            fields = tail.split()
+            if fields and fields[-1] in ("sender", "receiver"):
+                retransmits = int(fields[0]) if len(fields) > 1 and fields[0].isdigit() else 0
+                key = "sum_sent" if fields[-1] == "sender" else "sum_received"
+                summary[key] = {"bits_per_second": bps, "retransmits": retransmits}
+            else:
+                on_interval(bps / 1_000_000.0)
+    except BaseException:
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        proc.wait()
+        raise
+    proc.wait()
+
+    if errors:
+        return None, " ".join(errors)
+    if proc.returncode != 0 or not summary:
+        return None, "iperf3 exited with non-zero status"
+    return {"end": summary}, ""
+
 def parse_port_list_csv(raw):
     seen = set()
     ports = []
@@ -250,7 +394,15 @@ def evaluate_connectivity_quality(uplink_mbps, downlink_mbps):
         "Direct connectivity is moderate. Tunnel can work, but quality may vary by route and load.",
     )
 
-def run_direct_connectivity_measurement(target_host, port, duration, streams):
+def run_iperf3_direction(command_args, direction, streams, on_interval=None):
+    if on_interval is None:
+        return run_iperf3_json(command_args)
+    report = lambda mbps: on_interval(direction, mbps)
+    if iperf3_supports_json_stream():
+        return run_iperf3_json_stream(command_args, report)
+    return run_iperf3_text_stream(command_args, streams, report)
+
+def run_direct_connectivity_measurement(target_host, port, duration, streams, on_interval=None):
     base_cmd = [
         "iperf3",
         "-c",
@@ -266,11 +418,11 @@ def run_direct_connectivity_measurement(target_host, port, duration, streams):
         "-J",
     ]
 
-    down_payload, down_err = run_iperf3_json(base_cmd + ["-R"])
+    down_payload, down_err = run_iperf3_direction(base_cmd + ["-R"], "downlink", streams, on_interval)
     if down_payload is None:
         return None, f"Downlink test failed: {down_err}"
 
-    up_payload, up_err = run_iperf3_json(base_cmd)
+    up_payload, up_err = run_iperf3_direction(base_cmd, "uplink", streams, on_interval)
     if up_payload is None:
         return None, f"Uplink test failed: {up_err}"
 
@@ -290,23 +442,47 @@ def run_direct_connectivity_measurement(target_host, port, duration, streams):
         "retransmits_down": down["retransmits"],
     }, ""
 
-def run_direct_connectivity_benchmark(target_host, port, duration, streams):
+def run_direct_connectivity_benchmark(target_host, port, duration, streams, lease_port=None):
     if not ensure_iperf3_installed():
         return None
 
     print_header("🌐 Direct Connectivity Benchmark (iperf3)")
-    print_info(
-        f"Target={target_host}:{port} | Duration={duration}s | Streams={streams} | MSS={IPERF_TEST_MSS} | Mode=direct (no tunnel)"
-    )
+    if lease_port:
+        print_info(
+            f"Target={target_host} (port leased via :{lease_port}) | Duration={duration}s | "
+            f"Streams={streams} | MSS={IPERF_TEST_MSS} | Mode=direct (no tunnel)"
+        )
+        print_info("Requesting a free port from the lease coordinator...")
+        result, err = run_leased_connectivity_measurement(
+            target_host,
+            None,
+            int(duration),
+            int(streams),
+            lease_port,
+            on_queued=lambda position: print_info(f"All ports busy, waiting in lease queue (position {position})..."),
+        )
+        if result is not None:
+            port = result["port"]
+            print_info(f"Leased port {port} after waiting {result['lease_wait_seconds']:.1f}s.")
+    else:
+        print_info(
+            f"Target={target_host}:{port} | Duration={duration}s | Streams={streams} | MSS={IPERF_TEST_MSS} | Mode=direct (no tunnel)"
+        )
 
-    print_info("Running downlink + uplink test...")
-    result, err = run_direct_connectivity_measurement(target_host, int(port), int(duration), int(streams))
+        print_info("Running downlink + uplink test...")
+        result, err = run_direct_connectivity_measurement(target_host, int(port), int(duration), int(streams))
     if result is None:
         print_error(err)
-        print_info(
-            "Ensure remote iperf3 server is running: `iperf3 -s -p "
-            f"{port}`"
-        )
+        if lease_port:
+            print_info(
+                "Ensure remote node runs multi-port server mode with lease port "
+                f"{lease_port} reachable."
+            )
+        else:
+            print_info(
+                "Ensure remote iperf3 server is running: `iperf3 -s -p "
+                f"{port}`"
+            )
         return None
 
     down_mbps = result["downlink_mbps"]
@@ -386,7 +562,404 @@ def stop_iperf3_servers(server_procs):
             except Exception:
                 pass
 
-def run_multi_port_server_mode():
+# ==========================================
+# iperf3 Lease Coordinator
+# ==========================================
+class IperfLeasePool:
+    """Hands out time-limited, exclusive leases on a pool of iperf3 listeners.
+
+    Waiters are served first-come first-served; a waiter asking for a specific
+    port only lets later waiters skip ahead when they want a different port.
+    """
+
+    def __init__(self, ports):
+        self.cond = threading.Condition()
+        self.ports = [int(p) for p in ports]
+        self.port_set = set(self.ports)
+        self.leases = {}
+        self.waiters = []
+        self.started_at = time.time()
+        self.busy_seconds = {p: 0.0 for p in self.ports}
+        self.lease_counts = {p: 0 for p in self.ports}
+        self.next_id = 1
+        self.version = 0
+        self.granted = 0
+        self.expired = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.closed = False
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def enqueue(self, port, seconds, client):
+        with self.cond:
+            if self.closed or len(self.waiters) >= IPERF_LEASE_MAX_QUEUE:
+                return None
+            waiter = {
+                "port": None if port is None else int(port),
+                "seconds": float(seconds),
+                "client": str(client),
+                "enqueued_at": time.time(),
+                "lease": None,
+            }
+            self.waiters.append(waiter)
+            self._expire_locked()
+            self._dispatch_locked()
+            return waiter
+
+    def queue_position(self, waiter):
+        with self.cond:
+            if waiter in self.waiters:
+                return self.waiters.index(waiter) + 1
+            return 0
+
+    def wait_for_grant(self, waiter, is_cancelled=None):
+        with self.cond:
+            while waiter["lease"] is None:
+                if self.closed:
+                    return None
+                if is_cancelled is not None and is_cancelled():
+                    return None
+                self.cond.wait(1.0)
+                self._expire_locked()
+                self._dispatch_locked()
+            return waiter["lease"]
+
+    def cancel(self, waiter):
+        # Drops a queued waiter, or releases its lease if it was already granted.
+        with self.cond:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+                self.version += 1
+            elif waiter["lease"] is not None:
+                self._release_locked(waiter["lease"], time.time())
+            self._dispatch_locked()
+
+    def _release_locked(self, lease, now, expired=False):
+        port = lease["port"]
+        if self.leases.get(port) is not lease:
+            return
+        del self.leases[port]
+        self.busy_seconds[port] += max(0.0, min(now, lease["expires_at"]) - lease["granted_at"])
+        if expired:
+            self.expired += 1
+        self.version += 1
+        self.cond.notify_all()
+
+    def _expire_locked(self):
+        now = time.time()
+        for lease in [l for l in self.leases.values() if l["expires_at"] <= now]:
+            self._release_locked(lease, now, expired=True)
+
+    def _dispatch_locked(self):
+        if self.closed:
+            return
+        free = [p for p in self.ports if p not in self.leases]
+        for waiter in list(self.waiters):
+            if not free:
+                break
+            wanted = waiter["port"]
+            if wanted is None:
+                port = min(free, key=lambda p: (self.busy_seconds[p], self.lease_counts[p]))
+            elif wanted in free:
+                port = wanted
+            else:
+                continue
+            free.remove(port)
+            self._grant_locked(waiter, port)
+
+    def _grant_locked(self, waiter, port):
+        now = time.time()
+        lease = {
+            "id": f"{port}-{self.next_id}",
+            "port": port,
+            "client": waiter["client"],
+            "granted_at": now,
+            "expires_at": now + waiter["seconds"],
+            "waited": now - waiter["enqueued_at"],
+        }
+        self.next_id += 1
+        self.leases[port] = lease
+        self.waiters.remove(waiter)
+        waiter["lease"] = lease
+        self.lease_counts[port] += 1
+        self.granted += 1
+        self.wait_total += lease["waited"]
+        self.wait_max = max(self.wait_max, lease["waited"])
+        self.version += 1
+        self.cond.notify_all()
+
+    def snapshot(self):
+        with self.cond:
+            self._expire_locked()
+            now = time.time()
+            uptime = max(1e-6, now - self.started_at)
+            ports = []
+            for port in self.ports:
+                busy = self.busy_seconds[port]
+                lease = self.leases.get(port)
+                if lease is not None:
+                    busy += now - lease["granted_at"]
+                if busy <= 0 and not self.lease_counts[port]:
+                    continue
+                ports.append({
+                    "port": port,
+                    "leases": self.lease_counts[port],
+                    "busy_pct": min(100.0, busy / uptime * 100.0),
+                    "holder": lease["client"] if lease is not None else "",
+                })
+            ports.sort(key=lambda x: (x["busy_pct"], x["leases"]), reverse=True)
+            return {
+                "version": self.version,
+                "uptime": uptime,
+                "pool_size": len(self.ports),
+                "active": len(self.leases),
+                "queued": len(self.waiters),
+                "granted": self.granted,
+                "expired": self.expired,
+                "wait_avg": (self.wait_total / self.granted) if self.granted else 0.0,
+                "wait_max": self.wait_max,
+                "ports": ports,
+            }
+
+def _lease_peer_closed(sock):
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        if not readable:
+            return False
+        return sock.recv(1, socket.MSG_PEEK) == b""
+    except Exception:
+        return True
+
+class IperfLeaseRequestHandler(socketserver.StreamRequestHandler):
+    # Line-delimited JSON: acquire -> [queued] -> granted -> release/disconnect.
+
+    def send_message(self, payload):
+        self.wfile.write((json.dumps(payload) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def read_message(self):
+        raw = self.rfile.readline(4096)
+        if not raw:
+            return None
+        try:
+            payload = json.loads(raw.decode("utf-8", errors="replace"))
+        except Exception:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def handle(self):
+        client_ip = self.client_address[0]
+        if not self.server.register_client(client_ip):
+            self.send_message({"status": "error", "error": "too many lease connections from this client"})
+            return
+        try:
+            self.handle_acquire(client_ip)
+        finally:
+            self.server.unregister_client(client_ip)
+
+    def handle_acquire(self, client_ip):
+        pool = self.server.pool
+        request = self.read_message()
+        if request is None:
+            return
+        if request.get("op") != "acquire":
+            self.send_message({"status": "error", "error": "expected acquire request"})
+            return
+
+        port = request.get("port")
+        if port is not None:
+            try:
+                port = int(port)
+            except (TypeError, ValueError):
+                port = -1
+            if port not in pool.port_set:
+                self.send_message({"status": "error", "error": f"port {port} is not in the lease pool"})
+                return
+        try:
+            seconds = float(request.get("seconds") or IPERF_LEASE_DEFAULT_SECONDS)
+        except (TypeError, ValueError):
+            seconds = IPERF_LEASE_DEFAULT_SECONDS
+        if seconds > IPERF_LEASE_MAX_SECONDS:
+            self.send_message({
+                "status": "error",
+                "error": f"requested lease of {seconds:.0f}s exceeds the {IPERF_LEASE_MAX_SECONDS}s maximum",
+            })
+            return
+        seconds = max(1.0, seconds)
+        client = str(request.get("client") or client_ip)[:64]
+
+        waiter = pool.enqueue(port, seconds, client)
+        if waiter is None:
+            reason = "lease coordinator is shutting down" if pool.closed else "lease queue is full"
+            self.send_message({"status": "error", "error": reason})
+            return
+
+        lease = None
+        try:
+            if waiter["lease"] is None:
+                self.send_message({"status": "queued", "position": pool.queue_position(waiter)})
+            lease = pool.wait_for_grant(waiter, lambda: _lease_peer_closed(self.connection))
+            if lease is None:
+                if pool.closed:
+                    self.send_message({"status": "error", "error": "lease coordinator is shutting down"})
+                return
+            self.send_message({
+                "status": "granted",
+                "lease_id": lease["id"],
+                "port": lease["port"],
+                "seconds": seconds,
+                "waited": lease["waited"],
+            })
+            self.connection.settimeout(seconds + IPERF_LEASE_GRACE_SECONDS)
+            while True:
+                message = self.read_message()
+                if message is None or message.get("op") == "release":
+                    break
+        except OSError:
+            lease = None
+        finally:
+            pool.cancel(waiter)
+        if lease is not None:
+            try:
+                self.send_message({"status": "released"})
+            except OSError:
+                pass
+
+class IperfLeaseServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, lease_port, pool):
+        self.pool = pool
+        self.client_counts = {}
+        self.client_lock = threading.Lock()
+        super().__init__(("", int(lease_port)), IperfLeaseRequestHandler)
+
+    def register_client(self, client_ip):
+        with self.client_lock:
+            count = self.client_counts.get(client_ip, 0)
+            if count >= IPERF_LEASE_MAX_CONNECTIONS_PER_CLIENT:
+                return False
+            self.client_counts[client_ip] = count + 1
+            return True
+
+    def unregister_client(self, client_ip):
+        with self.client_lock:
+            count = self.client_counts.get(client_ip, 0) - 1
+            if count > 0:
+                self.client_counts[client_ip] = count
+            else:
+                self.client_counts.pop(client_ip, None)
+
+    def close(self):
+        # Close the pool first so queued handlers get an error instead of a lease on a dead port.
+        self.pool.close()
+        self.shutdown()
+        self.server_close()
+
+def start_iperf_lease_server(lease_port, ports):
+    pool = IperfLeasePool(ports)
+    try:
+        server = IperfLeaseServer(lease_port, pool)
+    except (OSError, OverflowError) as exc:
+        return None, f"failed to bind lease port {lease_port}: {exc}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, ""
+
+def print_lease_report(snapshot):
+    print_header("📊 Lease Report")
+    print(
+        f"Uptime={format_clock(snapshot['uptime'])} | Pool={snapshot['pool_size']} ports | "
+        f"Active={snapshot['active']} | Queued={snapshot['queued']}"
+    )
+    print(
+        f"Leases granted={snapshot['granted']} | expired={snapshot['expired']} | "
+        f"wait avg={snapshot['wait_avg']:.1f}s max={snapshot['wait_max']:.1f}s"
+    )
+    rows = snapshot["ports"][:IPERF_LEASE_REPORT_ROWS]
+    if not rows:
+        print_info("No leases handed out yet.")
+        return
+    for row in rows:
+        holder = f" holder={row['holder']}" if row["holder"] else ""
+        print(f"  port={row['port']} busy={row['busy_pct']:.1f}% leases={row['leases']}{holder}")
+    hidden = len(snapshot["ports"]) - len(rows)
+    if hidden > 0:
+        print_info(f"{hidden} more used ports not shown.")
+
+def acquire_iperf_lease(target_host, lease_port, port, seconds, on_queued=None):
+    try:
+        sock = socket.create_connection((target_host, int(lease_port)), timeout=10.0)
+    except OSError as exc:
+        return None, None, f"lease coordinator unreachable: {exc}"
+    try:
+        sock.settimeout(IPERF_LEASE_WAIT_TIMEOUT)
+        request = {
+            "op": "acquire",
+            "port": None if port is None else int(port),
+            "seconds": float(seconds),
+            "client": socket.gethostname(),
+        }
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        reader = sock.makefile("r", encoding="utf-8", errors="replace")
+        while True:
+            line = reader.readline()
+            if not line:
+                raise OSError("lease coordinator closed the connection")
+            reply = json.loads(line)
+            status = reply.get("status")
+            if status == "queued":
+                if on_queued is not None:
+                    on_queued(int(reply.get("position") or 0))
+                continue
+            if status == "granted":
+                return sock, reply, ""
+            raise OSError(str(reply.get("error") or f"unexpected reply: {line.strip()}"))
+    except socket.timeout:
+        err = f"timed out after {IPERF_LEASE_WAIT_TIMEOUT}s waiting for a lease"
+    except (OSError, ValueError) as exc:
+        err = f"lease request failed: {exc}"
+    sock.close()
+    return None, None, err
+
+def release_iperf_lease(sock):
+    try:
+        sock.sendall((json.dumps({"op": "release"}) + "\n").encode("utf-8"))
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+def run_leased_connectivity_measurement(target_host, port, duration, streams, lease_port, on_interval=None, on_queued=None):
+    seconds = 2 * int(duration) + IPERF_LEASE_GRACE_SECONDS
+    if seconds > IPERF_LEASE_MAX_SECONDS:
+        return None, f"test needs a {seconds}s lease, above the {IPERF_LEASE_MAX_SECONDS}s maximum; lower --duration"
+    sock, grant, err = acquire_iperf_lease(target_host, lease_port, port, seconds, on_queued=on_queued)
+    if sock is None:
+        return None, err
+    if float(grant.get("seconds") or 0.0) < seconds:
+        release_iperf_lease(sock)
+        return None, f"coordinator granted only {grant.get('seconds')}s of the {seconds}s lease needed"
+    try:
+        result, err = run_direct_connectivity_measurement(
+            target_host,
+            int(grant["port"]),
+            int(duration),
+            int(streams),
+            on_interval=on_interval,
+        )
+    finally:
+        release_iperf_lease(sock)
+    if result is not None:
+        result["lease_wait_seconds"] = float(grant.get("waited") or 0.0)
+    return result, err
+
+def run_multi_port_server_mode(lease_port=None):
     if not ensure_iperf3_installed():
         return
 
@@ -400,7 +973,7 @@ def run_multi_port_server_mode():
     def try_start(port):
         nonlocal failed_count
         p = int(port)
-        if p in attempted:
+        if p in attempted or p == lease_port:
             return False
         attempted.add(p)
         proc = start_iperf3_server_on_port(p)
@@ -440,18 +1013,306 @@ def run_multi_port_server_mode():
     print_header("📋 Port List For Client")
     print(csv_ports)
     print_info("Copy the exact comma-separated list to the client benchmark mode.")
-    print_info("Press Ctrl+C to stop all started iperf3 servers.")
 
+    lease_server = None
     try:
+        if lease_port:
+            lease_server, lease_err = start_iperf_lease_server(lease_port, started_ports)
+            if lease_server is None:
+                print_error(f"Lease coordinator disabled: {lease_err}")
+            else:
+                print_success(
+                    f"Lease coordinator listening on :{lease_port} "
+                    f"(clients: --lease --lease-port {lease_port})."
+                )
+        print_info("Press Ctrl+C to stop all started iperf3 servers.")
+
+        last_report = time.time()
+        last_version = 0
         while True:
             time.sleep(1)
+            if lease_server is None or time.time() - last_report < IPERF_LEASE_REPORT_SECONDS:
+                continue
+            last_report = time.time()
+            snapshot = lease_server.pool.snapshot()
+            if snapshot["version"] != last_version or snapshot["active"] or snapshot["queued"]:
+                last_version = snapshot["version"]
+                print_lease_report(snapshot)
     except KeyboardInterrupt:
         pass
     finally:
+        if lease_server is not None:
+            lease_server.close()
+            print_lease_report(lease_server.pool.snapshot())
         stop_iperf3_servers(started)
         print_info("Stopped all started iperf3 server listeners.")
 
-def run_multi_port_client_benchmark(target_host, ports, duration, streams):
+# ==========================================
+# Live Dashboard
+# ==========================================
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+
+def format_clock(seconds):
+    seconds = max(0, int(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours:d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+def render_sparkline(values, width):
+    samples = list(values)[-max(0, width):]
+    if not samples:
+        return ""
+    peak = max(samples)
+    if peak <= 0:
+        return SPARKLINE_BLOCKS[0] * len(samples)
+    top = len(SPARKLINE_BLOCKS) - 1
+    return "".join(SPARKLINE_BLOCKS[min(top, int(value / peak * top))] for value in samples)
+
+def rank_port_results(results):
+    return sorted(
+        results,
+        key=lambda x: (x.get("score_mbps", 0.0), x.get("downlink_mbps", 0.0), x.get("uplink_mbps", 0.0)),
+        reverse=True,
+    )
+
+class LiveSweepDashboard:
+    """Full-screen curses view of a multi-port sweep.
+
+    The measurement loop only records samples under a lock; a background
+    thread redraws at most every IPERF_LIVE_REFRESH_SECONDS.
+    """
+
+    def __init__(self, target_host, ports, duration, streams):
+        self.target_host = target_host
+        self.total = len(ports)
+        self.duration = int(duration)
+        self.streams = int(streams)
+        self.render_error = ""
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stdscr = None
+        self.started_at = time.time()
+        self.port_started_at = self.started_at
+        self.completed_seconds = 0.0
+        self.index = 0
+        self.port = None
+        self.phase = "starting"
+        self.current = {"downlink": None, "uplink": None}
+        self.history = {"downlink": [], "uplink": []}
+        self.results = []
+        self.failed = []
+
+    def start(self):
+        if curses is None:
+            return False, "python curses module is not available"
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return False, "stdout is not an interactive terminal"
+        try:
+            locale.setlocale(locale.LC_ALL, "")
+            self.stdscr = curses.initscr()
+            curses.noecho()
+            curses.cbreak()
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass
+            if curses.has_colors():
+                curses.start_color()
+                curses.use_default_colors()
+                curses.init_pair(1, curses.COLOR_GREEN, -1)
+                curses.init_pair(2, curses.COLOR_YELLOW, -1)
+                curses.init_pair(3, curses.COLOR_RED, -1)
+                curses.init_pair(4, curses.COLOR_CYAN, -1)
+        except Exception as exc:
+            self._restore_terminal()
+            return False, f"failed to initialize curses: {exc}"
+        self.started_at = time.time()
+        self.thread = threading.Thread(target=self._render_loop, daemon=True)
+        self.thread.start()
+        return True, ""
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2.0)
+            self.thread = None
+        self._restore_terminal()
+        if self.render_error:
+            print_error(f"Live dashboard stopped rendering: {self.render_error}")
+
+    def _restore_terminal(self):
+        if self.stdscr is None:
+            return
+        try:
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+        except Exception:
+            pass
+        self.stdscr = None
+
+    def begin_port(self, index, port):
+        with self.lock:
+            self.index = int(index)
+            self.port = int(port)
+            self.phase = "connecting"
+            self.port_started_at = time.time()
+            self.current = {"downlink": None, "uplink": None}
+            self.history = {"downlink": [], "uplink": []}
+
+    def set_phase(self, phase):
+        with self.lock:
+            self.phase = str(phase)
+
+    def record_interval(self, direction, mbps):
+        with self.lock:
+            self.phase = direction
+            self.current[direction] = float(mbps)
+            samples = self.history[direction]
+            samples.append(float(mbps))
+            if len(samples) > IPERF_LIVE_HISTORY_SECONDS:
+                del samples[0]
+
+    def record_result(self, result):
+        with self.lock:
+            self.results.append(result)
+            self._finish_port()
+
+    def record_failure(self, port, err):
+        with self.lock:
+            self.failed.append((int(port), str(err)))
+            self._finish_port()
+
+    def _finish_port(self):
+        self.completed_seconds += time.time() - self.port_started_at
+        self.port = None
+        self.phase = "idle"
+
+    def _render_loop(self):
+        while not self.stop_event.is_set():
+            with self.lock:
+                snapshot = self._snapshot()
+            try:
+                self._draw(snapshot)
+            except curses.error:
+                pass
+            except Exception as exc:
+                self.render_error = f"{type(exc).__name__}: {exc}"
+                return
+            self.stop_event.wait(IPERF_LIVE_REFRESH_SECONDS)
+
+    def _snapshot(self):
+        now = time.time()
+        done = len(self.results) + len(self.failed)
+        remaining = self.total - done
+        if done:
+            per_port = self.completed_seconds / done
+        else:
+            per_port = 2.0 * self.duration + 2.0
+        eta = per_port * remaining
+        if self.port is not None:
+            eta -= min(per_port, now - self.port_started_at)
+        return {
+            "now": now,
+            "done": done,
+            "eta": max(0.0, eta),
+            "elapsed": now - self.started_at,
+            "index": self.index,
+            "port": self.port,
+            "phase": self.phase,
+            "port_elapsed": now - self.port_started_at,
+            "current": dict(self.current),
+            "history": {key: list(value) for key, value in self.history.items()},
+            "ranked": rank_port_results(self.results),
+            "succeeded": len(self.results),
+            "failed": list(self.failed),
+        }
+
+    def _color(self, pair):
+        if curses.has_colors():
+            return curses.color_pair(pair)
+        return curses.A_NORMAL
+
+    def _quality_attr(self, quality):
+        return {
+            "excellent": self._color(1),
+            "good": self._color(1),
+            "moderate": self._color(2),
+            "poor": self._color(3),
+        }.get(quality, curses.A_NORMAL)
+
+    def _draw(self, snap):
+        scr = self.stdscr
+        height, width = scr.getmaxyx()
+        scr.erase()
+        row = [0]
+
+        def put(text, attr=curses.A_NORMAL):
+            if row[0] >= height:
+                return
+            scr.addnstr(row[0], 0, str(text), max(0, width - 1), attr)
+            row[0] += 1
+
+        put(
+            f"🌐 Live Multi-Port Sweep  target={self.target_host}  "
+            f"duration={self.duration}s  streams={self.streams}  MSS={IPERF_TEST_MSS}",
+            curses.A_BOLD | self._color(4),
+        )
+        put("")
+
+        done = snap["done"]
+        ratio = (done / self.total) if self.total else 1.0
+        bar_width = max(10, min(50, width - 50))
+        filled = int(bar_width * ratio)
+        put(
+            f"Progress [{'#' * filled}{'.' * (bar_width - filled)}] "
+            f"{done}/{self.total} ({ratio * 100:.0f}%)  "
+            f"elapsed {format_clock(snap['elapsed'])}  ETA {format_clock(snap['eta'])}"
+        )
+        put(f"Succeeded: {snap['succeeded']}  Failed: {len(snap['failed'])}")
+        put("")
+
+        if snap["port"] is None:
+            put("Active: -", curses.A_BOLD)
+        else:
+            put(
+                f"Active: [{snap['index']}/{self.total}] port={snap['port']}  "
+                f"phase={snap['phase']}  t={format_clock(snap['port_elapsed'])}",
+                curses.A_BOLD,
+            )
+        spark_width = max(0, min(IPERF_LIVE_HISTORY_SECONDS, width - 34))
+        for direction, label in (("downlink", "Down"), ("uplink", "Up  ")):
+            mbps = snap["current"][direction]
+            value = "     -     " if mbps is None else f"{mbps:8.2f} Mbps"
+            put(f"  {label} {value}  {render_sparkline(snap['history'][direction], spark_width)}")
+        put("")
+
+        put("🏆 Leaderboard", curses.A_BOLD)
+        put(f"  {'#':>3}  {'port':>5}  {'score':>9}  {'down':>9}  {'up':>9}  {'retr u/d':>11}  quality")
+        failure_rows = min(IPERF_LIVE_FAILURE_ROWS, len(snap["failed"]))
+        board_rows = max(0, height - row[0] - (failure_rows + 2 if failure_rows else 0))
+        if not snap["ranked"]:
+            put("  (no results yet)")
+        for idx, res in enumerate(snap["ranked"][:board_rows], start=1):
+            put(
+                f"  {idx:>3}  {res['port']:>5}  {res['score_mbps']:9.2f}  "
+                f"{res['downlink_mbps']:9.2f}  {res['uplink_mbps']:9.2f}  "
+                f"{str(res['retransmits_up']) + '/' + str(res['retransmits_down']):>11}  {res['quality']}",
+                self._quality_attr(res["quality"]),
+            )
+
+        if failure_rows:
+            put("")
+            put("Recent failures", curses.A_BOLD | self._color(3))
+            for port, err in snap["failed"][-failure_rows:]:
+                put(f"  port={port}: {err}", self._color(3))
+
+        scr.refresh()
+
+def run_multi_port_client_benchmark(target_host, ports, duration, streams, live=False, lease_port=None):
     if not ensure_iperf3_installed():
         return None
     if not ports:
@@ -464,31 +1325,80 @@ def run_multi_port_client_benchmark(target_host, ports, duration, streams):
         f"Target={target_host} | Ports={total} | Duration={duration}s | "
         f"Streams={streams} | MSS={IPERF_TEST_MSS}"
     )
+    if lease_port:
+        print_info(f"Using lease coordinator at {target_host}:{lease_port}; busy ports are queued, not failed.")
+
+    dashboard = None
+    if live:
+        dashboard = LiveSweepDashboard(target_host, ports, duration, streams)
+        ok, reason = dashboard.start()
+        if not ok:
+            print_error(f"Live dashboard unavailable: {reason}. Falling back to plain output.")
+            dashboard = None
 
     results = []
     failed = []
-    for index, port in enumerate(ports, start=1):
-        print_info(f"[{index}/{total}] Testing {target_host}:{port} ...")
-        result, err = run_direct_connectivity_measurement(
-            target_host,
-            int(port),
-            int(duration),
-            int(streams),
-        )
-        if result is None:
-            failed.append((int(port), err))
-            print_error(f"[{index}/{total}] port={int(port)} failed: {err}")
-            continue
+    try:
+        for index, port in enumerate(ports, start=1):
+            if dashboard is not None:
+                dashboard.begin_port(index, port)
+            else:
+                print_info(f"[{index}/{total}] Testing {target_host}:{port} ...")
+            on_interval = dashboard.record_interval if dashboard is not None else None
+            if lease_port:
+                if dashboard is not None:
+                    on_queued = lambda position: dashboard.set_phase(f"lease queue #{position}")
+                else:
+                    on_queued = lambda position: print_info(
+                        f"[{index}/{total}] port={int(port)} busy, waiting in lease queue (position {position})..."
+                    )
+                result, err = run_leased_connectivity_measurement(
+                    target_host,
+                    int(port),
+                    int(duration),
+                    int(streams),
+                    lease_port,
+                    on_interval=on_interval,
+                    on_queued=on_queued,
+                )
+            else:
+                result, err = run_direct_connectivity_measurement(
+                    target_host,
+                    int(port),
+                    int(duration),
+                    int(streams),
+                    on_interval=on_interval,
+                )
+            if result is None:
+                failed.append((int(port), err))
+                if dashboard is not None:
+                    dashboard.record_failure(port, err)
+                else:
+                    print_error(f"[{index}/{total}] port={int(port)} failed: {err}")
+                continue
 
-        results.append(result)
-        print_success(
-            f"[{index}/{total}] port={result['port']} "
-            f"score={result['score_mbps']:.2f} Mbps "
-            f"down={result['downlink_mbps']:.2f} Mbps "
-            f"up={result['uplink_mbps']:.2f} Mbps "
-            f"retrans(up/down)={result['retransmits_up']}/{result['retransmits_down']} "
-            f"quality={result['quality']}"
-        )
+            results.append(result)
+            if dashboard is not None:
+                dashboard.record_result(result)
+                continue
+            print_success(
+                f"[{index}/{total}] port={result['port']} "
+                f"score={result['score_mbps']:.2f} Mbps "
+                f"down={result['downlink_mbps']:.2f} Mbps "
+                f"up={result['uplink_mbps']:.2f} Mbps "
+                f"retrans(up/down)={result['retransmits_up']}/{result['retransmits_down']} "
+                f"quality={result['quality']}"
+            )
+    finally:
+        if dashboard is not None:
+            dashboard.stop()
+
+    if dashboard is not None and failed:
+        print_header("❌ Failed Ports")
+        for port, err in failed[-10:]:
+            print_error(f"port={port} failed: {err}")
+        if len(failed) > 10:
+            print_info(f"{len(failed) - 10} earlier failures not shown.")
 
     if not results:
         print_error("All port tests failed.")
@@ -496,11 +1406,7 @@ def run_multi_port_client_benchmark(target_host, ports, duration, streams):
             print_info(f"First error: {failed[0][0]} -> {failed[0][1]}")
         return None
 
-    ranked = sorted(
-        results,
-        key=lambda x: (x.get("score_mbps", 0.0), x.get("downlink_mbps", 0.0), x.get("uplink_mbps", 0.0)),
-        reverse=True,
-    )
+    ranked = rank_port_results(results)
     top_count = min(IPERF_MULTI_PORT_TOP_COUNT, len(ranked))
 
     print_header(f"🏆 Top {top_count} Ports")
@@ -514,6 +1420,11 @@ def run_multi_port_client_benchmark(target_host, ports, duration, streams):
         )
 
     print_info(f"Successful tests: {len(results)}/{total}")
+    if lease_port:
+        waits = [row.get("lease_wait_seconds", 0.0) for row in results]
+        print_info(
+            f"Lease wait: total={sum(waits):.1f}s avg={sum(waits) / len(waits):.1f}s max={max(waits):.1f}s"
+        )
     if failed:
         print_info(f"Failed tests: {len(failed)} (showing up to 10 ports)")
         print_info(",".join(str(p) for p, _ in failed[:10]))
@@ -565,7 +1476,11 @@ def direct_connectivity_test_menu(default_host=""):
                 except KeyboardInterrupt:
                     pass
             elif server_mode == "2":
-                run_multi_port_server_mode()
+                lease_port = prompt_int("Lease coordinator port (0 = disabled)", 0)
+                while lease_port < 0 or lease_port > 65535:
+                    print_error("Port must be between 0 and 65535.")
+                    lease_port = prompt_int("Lease coordinator port (0 = disabled)", 0)
+                run_multi_port_server_mode(lease_port=lease_port)
             else:
                 print_error("Invalid mode.")
             input("\nPress Enter to continue...")
@@ -595,8 +1510,18 @@ def direct_connectivity_test_menu(default_host=""):
             streams = prompt_int("Parallel streams", IPERF_TEST_DEFAULT_STREAMS)
             if streams < 1:
                 streams = 1
+            lease_port = prompt_int("Server lease coordinator port (0 = not used)", 0)
+            while lease_port < 0 or lease_port > 65535:
+                print_error("Port must be between 0 and 65535.")
+                lease_port = prompt_int("Server lease coordinator port (0 = not used)", 0)
 
             if client_mode == "1":
+                if lease_port:
+                    run_direct_connectivity_benchmark(
+                        target_host, None, int(duration), int(streams), lease_port=lease_port
+                    )
+                    input("\nPress Enter to continue...")
+                    continue
                 port = prompt_int("Remote iperf3 port", IPERF_TEST_DEFAULT_PORT)
                 while port < 1 or port > 65535:
                     print_error("Port must be between 1 and 65535.")
@@ -612,7 +1537,15 @@ def direct_connectivity_test_menu(default_host=""):
                     print_error("No valid ports provided.")
                     input("\nPress Enter to continue...")
                     continue
-                run_multi_port_client_benchmark(target_host, ports, int(duration), int(streams))
+                live_raw = input_default("Show live dashboard? (y/n)", "y").strip().lower()
+                run_multi_port_client_benchmark(
+                    target_host,
+                    ports,
+                    int(duration),
+                    int(streams),
+                    live=live_raw.startswith("y"),
+                    lease_port=lease_port,
+                )
             else:
                 print_error("Invalid mode.")
             input("\nPress Enter to continue...")
@@ -635,11 +1568,21 @@ def parse_args():
                         help=f"Test duration in seconds (client mode, default: {IPERF_TEST_DEFAULT_DURATION})")
     parser.add_argument("--streams", type=int, default=IPERF_TEST_DEFAULT_STREAMS,
                         help=f"Number of parallel streams (client mode, default: {IPERF_TEST_DEFAULT_STREAMS})")
+    parser.add_argument("--live", action="store_true",
+                        help="Show a live full-screen dashboard during multi-port client test")
+    parser.add_argument("--lease", action="store_true",
+                        help="Server: run the port lease coordinator (multi-port only). "
+                             "Client: queue for ports via the coordinator instead of failing on busy ports")
+    parser.add_argument("--lease-port", type=int, default=IPERF_LEASE_DEFAULT_PORT,
+                        help=f"Lease coordinator port (default: {IPERF_LEASE_DEFAULT_PORT})")
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
+    if args.lease and (args.lease_port < 1 or args.lease_port > 65535):
+        print_error("Error: --lease-port must be between 1 and 65535.")
+        sys.exit(1)
 
     if args.mode == "menu":
         direct_connectivity_test_menu()
@@ -648,8 +1591,10 @@ def main():
         if not ensure_iperf3_installed():
             sys.exit(1)
         if args.multi:
-            run_multi_port_server_mode()
+            run_multi_port_server_mode(lease_port=args.lease_port if args.lease else None)
         else:
+            if args.lease:
+                print_info("--lease only applies to multi-port server mode; ignoring it.")
             print_info(f"Starting iperf3 server on :{args.port} (Ctrl+C to stop)...")
             try:
                 run_command_stream(f"iperf3 -s -p {args.port}")
@@ -662,6 +1607,7 @@ def main():
         if not args.host:
             print_error("Error: --host is required when running in client mode.")
             sys.exit(1)
+        lease_port = args.lease_port if args.lease else None
 
         if args.multi:
             if args.ports:
@@ -675,9 +1621,18 @@ def main():
                 print_error("Error: No valid ports provided for multi-port test.")
                 sys.exit(1)
             
-            run_multi_port_client_benchmark(args.host, ports, args.duration, args.streams)
+            run_multi_port_client_benchmark(
+                args.host,
+                ports,
+                args.duration,
+                args.streams,
+                live=args.live,
+                lease_port=lease_port,
+            )
         else:
-            run_direct_connectivity_benchmark(args.host, args.port, args.duration, args.streams)
+            run_direct_connectivity_benchmark(
+                args.host, args.port, args.duration, args.streams, lease_port=lease_port
+            )
 
 
 if __name__ == "__main__":